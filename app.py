@@ -2,9 +2,18 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 from numpy_financial import pmt, fv, pv
-from datetime import datetime, date 
+from datetime import date 
 import altair as alt
 from collections import defaultdict
+from plan_inputs import PlanInputs
+
+# — TABLE DISPLAY HELPERS —
+def number_columns(fmt):
+    """Column configs that show each column in fmt with its printf format, centred."""
+    return {
+        col: st.column_config.NumberColumn(format=spec, alignment="center")
+        for col, spec in fmt.items()
+    }
 
 st.set_page_config(page_title="Retirement Planner", layout="wide")
 
@@ -215,64 +224,32 @@ st.subheader("Projected Balance by Net Return Rates")
 # --- Parameters (these would normally come from sidebar inputs) ---
 rates = np.arange(0.04, 0.13, 0.01)  # 4% to 12%
 start_year = today.year
-end_year = start_year + years_to_retire
 
 # Create base dataframe for output
 df_sens = pd.DataFrame({'Year': np.arange(0, years_to_retire + 1)})
 df_sens['Age'] = current_age + df_sens['Year']
 df_sens['Calendar Year'] = today.year + df_sens['Year']
 
-# Build list of monthly investments: (date, amount)
-monthly_contribs = []
-
-# Base monthly investment
-if monthly_invest > 0:
-    current = monthly_start
-    while current <= datetime(end_year, 12, 1).date():
-        monthly_contribs.append((current, monthly_invest))
-        if current.month == 12:
-            current = current.replace(year=current.year + 1, month=1)
-        else:
-            current = current.replace(month=current.month + 1)
-
-# Additional monthly investments
-for mdt, mamt in zip(additional_month_dts, additional_month_amts):
-    if mamt <= 0:
-        continue
-    current = mdt
-    while current <= datetime(end_year, 12, 1).date():
-        monthly_contribs.append((current, mamt))
-        if current.month == 12:
-            current = current.replace(year=current.year + 1, month=1)
-        else:
-            current = current.replace(month=current.month + 1)
-
-# Add all lump sums (on their dates)
-lumps = []
-if first_lump > 0:
-    lumps.append((first_lump_date, first_lump))
-for dt, amt in zip(additional_dts, additional_amts):
-    if amt > 0:
-        lumps.append((dt, amt))
+# Collect the plan inputs; dates become month indices and amounts arrays
+plan = PlanInputs.from_dates(
+    start_year, years_to_retire, years_post,
+    gross_return_rate, inflation_rate, monthly_expenses,
+    lump_amts=[first_lump] + additional_amts,
+    lump_dates=[first_lump_date] + additional_dts,
+    monthly_amts=[monthly_invest] + additional_month_amts,
+    monthly_dates=[monthly_start] + additional_month_dts,
+)
 
+# Monthly investments and lump sums paid in each calendar year
+yearly_totals = plan.yearly_contributions()
 
 # Initialize balance for each rate
 for rate in rates:
     balances = []
     balance = 0.0  # start from zero
-    for year in df_sens['Calendar Year']:
-        # sum of monthly investment for this year
-        year_monthly_total = sum(
-            amount for date, amount in monthly_contribs if date.year == year
-        )
-
-        # sum of lump sums in this year
-        year_lump_total = sum(
-            amount for date, amount in lumps if date.year == year
-        )
-
+    for year_total in yearly_totals:
         # add to balance BEFORE compounding
-        balance += year_monthly_total + year_lump_total
+        balance += year_total
 
         # apply 1 year compound growth
         balance *= (1 + rate)
@@ -283,10 +260,9 @@ for rate in rates:
     df_sens[f"{int(rate * 100)}%"] = balances
 
 # Format and display
-fmt = {col: "{:,.2f}" for col in df_sens.columns if col.endswith('%')}
-fmt.update({"Year": "{:.0f}", "Age": "{:.0f}", "Calendar Year": "{:.0f}"})
-styled = df_sens.style.format(fmt).set_properties(**{'text-align': 'center'})
-st.dataframe(styled)
+fmt = {col: "%,.2f" for col in df_sens.columns if col.endswith('%')}
+fmt.update({"Year": "%d", "Age": "%d", "Calendar Year": "%d"})
+st.dataframe(df_sens, column_config=number_columns(fmt))
 
 
 # — CHART: Projected Balance by Net Return Rates —
@@ -351,22 +327,16 @@ df_disp = pd.DataFrame({
 
 # Formatting & display
 disp_fmt = {
-    "Year":          "{:.0f}",
-    "Age":           "{:.0f}",
-    "Calendar Year": "{:.0f}",
-    "Start Balance": "{:,.2f}",
-    "Returns":       "{:,.2f}",
-    "Withdrawal":    "{:,.2f}",
-    "End Balance":   "{:,.2f}"
+    "Year":          "%d",
+    "Age":           "%d",
+    "Calendar Year": "%d",
+    "Start Balance": "%,.2f",
+    "Returns":       "%,.2f",
+    "Withdrawal":    "%,.2f",
+    "End Balance":   "%,.2f"
 }
 
-st.dataframe(
-    df_disp
-      .style
-      .format(disp_fmt)
-      .set_properties(**{"text-align":"center"}),
-    width=800
-)
+st.dataframe(df_disp, column_config=number_columns(disp_fmt), width=800)
 
 # — CHART: Depletion Over Time —
 # Add Calendar Year and Age columns first
@@ -432,20 +402,14 @@ df_longevity = pd.DataFrame({
 })
 
 longevity_fmt = {
-    "Year":          "{:.0f}",
-    "Start Balance": "{:,.2f}",
-    "Returns":       "{:,.2f}",
-    "Withdrawal":    "{:,.2f}",
-    "End Balance":   "{:,.2f}"
+    "Year":          "%d",
+    "Start Balance": "%,.2f",
+    "Returns":       "%,.2f",
+    "Withdrawal":    "%,.2f",
+    "End Balance":   "%,.2f"
 }
 
-st.dataframe(
-    df_longevity
-        .style
-        .format(longevity_fmt)
-        .set_properties(**{"text-align":"center"}),
-    width=800
-)
+st.dataframe(df_longevity, column_config=number_columns(longevity_fmt), width=800)
 
 # — CHART: Longevity Simulation —
 df_longevity["Calendar Year"] = today.year + years_to_retire + df_longevity["Year"]
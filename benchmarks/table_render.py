@@ -0,0 +1,63 @@
+"""Time the old Styler table path against the column-config path.
+
+Builds a 60-year x 100-rate sensitivity table shaped like the one in
+app.py and times the server-side work ``st.dataframe`` does for each
+display path (formatting, styling and Arrow serialization). Browser-side
+rendering is not included.
+
+Run with: python benchmarks/table_render.py 2>/dev/null
+(stderr carries Streamlit's "missing ScriptRunContext" bare-mode warnings.)
+"""
+import timeit
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+YEARS = 60
+RATES = 100
+REPEAT = 5
+NUMBER = 5
+
+
+def number_columns(fmt):
+    # Same as app.py; importing app.py would run the whole page.
+    return {
+        col: st.column_config.NumberColumn(format=spec, alignment="center")
+        for col, spec in fmt.items()
+    }
+
+
+def build_table():
+    df = pd.DataFrame({"Year": np.arange(0, YEARS + 1)})
+    df["Age"] = 30 + df["Year"]
+    df["Calendar Year"] = 2026 + df["Year"]
+    growth = 1 + np.linspace(0.01, 0.20, RATES)
+    balances = 12000 * np.cumprod(np.tile(growth, (YEARS + 1, 1)), axis=0)
+    for i, rate in enumerate(np.linspace(1, 20, RATES)):
+        df[f"{rate:.2f}%"] = balances[:, i]
+    return df
+
+
+def styler_path(df):
+    fmt = {col: "{:,.2f}" for col in df.columns if col.endswith('%')}
+    fmt.update({"Year": "{:.0f}", "Age": "{:.0f}", "Calendar Year": "{:.0f}"})
+    st.dataframe(df.style.format(fmt).set_properties(**{'text-align': 'center'}))
+
+
+def column_config_path(df):
+    fmt = {col: "%,.2f" for col in df.columns if col.endswith('%')}
+    fmt.update({"Year": "%d", "Age": "%d", "Calendar Year": "%d"})
+    st.dataframe(df, column_config=number_columns(fmt))
+
+
+def main():
+    df = build_table()
+    print(f"table: {len(df)} rows x {len(df.columns)} columns")
+    for name, func in (("styler", styler_path), ("column_config", column_config_path)):
+        times = timeit.repeat(lambda: func(df), repeat=REPEAT, number=NUMBER)
+        print(f"{name:>14}: {min(times) / NUMBER * 1000:8.2f} ms per render (best of {REPEAT})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+"""Compact plan-input model for the retirement planner.
+
+Dates are stored as integer month indices (``year * 12 + month - 1``) and
+amounts as float arrays, so a plan can be hashed, serialized and fed to the
+projection code without walking Python lists of dates.
+"""
+import hashlib
+import operator
+
+import numpy as np
+
+
+def month_index(d):
+    """Month index of a date; the day of month is dropped."""
+    return d.year * 12 + d.month - 1
+
+
+def _frozen(values, dtype):
+    arr = np.array(values, dtype=dtype).reshape(-1)
+    arr.flags.writeable = False
+    return arr
+
+
+def _check_values(years_to_retire, years_post, return_rate, inflation_rate,
+                  monthly_expenses, lump_amts, lump_months, monthly_amts, monthly_months):
+    """Range checks shared by a single plan (scalars) and a batch (arrays)."""
+    if np.any(np.less(years_to_retire, 0)):
+        raise ValueError("years_to_retire must be >= 0")
+    if np.any(np.less(years_post, 1)):
+        raise ValueError("years_post must be >= 1")
+    if not np.all(np.isfinite(return_rate) & np.greater(return_rate, -1)):
+        raise ValueError("return_rate must be finite and > -100%")
+    if not np.all(np.isfinite(inflation_rate) & np.greater(inflation_rate, -1)):
+        raise ValueError("inflation_rate must be finite and > -100%")
+    if not np.all(np.isfinite(monthly_expenses) & np.greater_equal(monthly_expenses, 0)):
+        raise ValueError("monthly_expenses must be finite and >= 0")
+    for amts, months, label in (
+        (lump_amts, lump_months, "lump"),
+        (monthly_amts, monthly_months, "monthly"),
+    ):
+        if not np.isfinite(amts).all():
+            raise ValueError(f"{label} amounts must be finite")
+        if (months < 0).any():
+            raise ValueError(f"{label} dates must be on or after year 0")
+
+
+class _Frozen:
+    """Blocks attribute assignment so a cached key can't go stale."""
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+
+class PlanInputs(_Frozen):
+    """Inputs for one plan.
+
+    Lump sums are (amount, month) pairs. Monthly investments are streams
+    that pay ``amount`` every month from their start month until December
+    of the retirement year. The base lump sum and base monthly investment
+    are simply the first entries of each pair of arrays.
+    """
+
+    __slots__ = (
+        "start_year", "years_to_retire", "years_post",
+        "return_rate", "inflation_rate", "monthly_expenses",
+        "lump_amts", "lump_months", "monthly_amts", "monthly_months",
+        "_key",
+    )
+
+    def __init__(self, start_year, years_to_retire, years_post,
+                 return_rate, inflation_rate, monthly_expenses,
+                 lump_amts=(), lump_months=(), monthly_amts=(), monthly_months=()):
+        init = object.__setattr__
+        init(self, "start_year", int(start_year))
+        init(self, "years_to_retire", int(years_to_retire))
+        init(self, "years_post", int(years_post))
+        init(self, "return_rate", float(return_rate))
+        init(self, "inflation_rate", float(inflation_rate))
+        init(self, "monthly_expenses", float(monthly_expenses))
+        init(self, "lump_amts", _frozen(lump_amts, np.float64))
+        init(self, "lump_months", _frozen(lump_months, np.int64))
+        init(self, "monthly_amts", _frozen(monthly_amts, np.float64))
+        init(self, "monthly_months", _frozen(monthly_months, np.int64))
+        init(self, "_key", None)
+        self.validate()
+
+    @classmethod
+    def from_dates(cls, start_year, years_to_retire, years_post,
+                   return_rate, inflation_rate, monthly_expenses,
+                   lump_amts=(), lump_dates=(), monthly_amts=(), monthly_dates=()):
+        """Build a plan from amounts and ``date`` objects, as read from the sidebar."""
+        return cls(
+            start_year, years_to_retire, years_post,
+            return_rate, inflation_rate, monthly_expenses,
+            lump_amts, [month_index(d) for d in lump_dates],
+            monthly_amts, [month_index(d) for d in monthly_dates],
+        )
+
+    def validate(self):
+        """Raise ValueError if the inputs are inconsistent."""
+        if len(self.lump_amts) != len(self.lump_months):
+            raise ValueError("lump amounts and dates differ in length")
+        if len(self.monthly_amts) != len(self.monthly_months):
+            raise ValueError("monthly amounts and dates differ in length")
+        _check_values(
+            self.years_to_retire, self.years_post, self.return_rate,
+            self.inflation_rate, self.monthly_expenses,
+            self.lump_amts, self.lump_months, self.monthly_amts, self.monthly_months,
+        )
+
+    @property
+    def end_year(self):
+        return self.start_year + self.years_to_retire
+
+    @property
+    def key(self):
+        """Stable hex digest of the inputs, usable as a cache key."""
+        if self._key is None:
+            h = hashlib.blake2b(digest_size=16)
+            h.update(np.array([
+                self.start_year, self.years_to_retire, self.years_post,
+                len(self.lump_amts), len(self.monthly_amts),
+            ], dtype=np.int64).tobytes())
+            h.update(np.array([
+                self.return_rate, self.inflation_rate, self.monthly_expenses,
+            ], dtype=np.float64).tobytes())
+            for arr in (self.lump_amts, self.lump_months,
+                        self.monthly_amts, self.monthly_months):
+                h.update(arr.tobytes())
+            object.__setattr__(self, "_key", h.hexdigest())
+        return self._key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __eq__(self, other):
+        if not isinstance(other, PlanInputs):
+            return NotImplemented
+        return self.key == other.key
+
+    def __repr__(self):
+        return (f"PlanInputs(start_year={self.start_year}, "
+                f"years_to_retire={self.years_to_retire}, "
+                f"lumps={len(self.lump_amts)}, monthly={len(self.monthly_amts)}, "
+                f"key={self.key[:8]})")
+
+    def to_dict(self):
+        """JSON-friendly representation; inverse of ``from_dict``."""
+        return {
+            "start_year": self.start_year,
+            "years_to_retire": self.years_to_retire,
+            "years_post": self.years_post,
+            "return_rate": self.return_rate,
+            "inflation_rate": self.inflation_rate,
+            "monthly_expenses": self.monthly_expenses,
+            "lump_amts": self.lump_amts.tolist(),
+            "lump_months": self.lump_months.tolist(),
+            "monthly_amts": self.monthly_amts.tolist(),
+            "monthly_months": self.monthly_months.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+    def yearly_contributions(self):
+        """Total invested in each calendar year from start_year to end_year."""
+        return PlanBatch.from_plans([self]).yearly_contributions()[0, :self.years_to_retire + 1]
+
+
+class PlanBatch(_Frozen):
+    """A batch of plans stored column-wise.
+
+    Scalars are one array per field. Lump sums and monthly streams of all
+    plans are concatenated, with ``*_offsets`` marking where each plan's
+    entries start (plan ``i`` owns ``offsets[i]:offsets[i + 1]``).
+    """
+
+    __slots__ = (
+        "start_year", "years_to_retire", "years_post",
+        "return_rate", "inflation_rate", "monthly_expenses",
+        "lump_amts", "lump_months", "lump_offsets",
+        "monthly_amts", "monthly_months", "monthly_offsets",
+        "_key",
+    )
+    _SCALARS = __slots__[:6]
+    _FIELDS = __slots__[:-1]
+
+    def __init__(self, start_year, years_to_retire, years_post,
+                 return_rate, inflation_rate, monthly_expenses,
+                 lump_amts, lump_months, lump_offsets,
+                 monthly_amts, monthly_months, monthly_offsets):
+        init = object.__setattr__
+        init(self, "start_year", _frozen(start_year, np.int64))
+        init(self, "years_to_retire", _frozen(years_to_retire, np.int64))
+        init(self, "years_post", _frozen(years_post, np.int64))
+        init(self, "return_rate", _frozen(return_rate, np.float64))
+        init(self, "inflation_rate", _frozen(inflation_rate, np.float64))
+        init(self, "monthly_expenses", _frozen(monthly_expenses, np.float64))
+        init(self, "lump_amts", _frozen(lump_amts, np.float64))
+        init(self, "lump_months", _frozen(lump_months, np.int64))
+        init(self, "lump_offsets", _frozen(lump_offsets, np.int64))
+        init(self, "monthly_amts", _frozen(monthly_amts, np.float64))
+        init(self, "monthly_months", _frozen(monthly_months, np.int64))
+        init(self, "monthly_offsets", _frozen(monthly_offsets, np.int64))
+        init(self, "_key", None)
+        self.validate()
+
+    @classmethod
+    def from_plans(cls, plans):
+        """Pack a sequence of ``PlanInputs`` into one batch."""
+        plans = list(plans)
+        return cls(
+            [p.start_year for p in plans],
+            [p.years_to_retire for p in plans],
+            [p.years_post for p in plans],
+            [p.return_rate for p in plans],
+            [p.inflation_rate for p in plans],
+            [p.monthly_expenses for p in plans],
+            *cls._pack([p.lump_amts for p in plans], [p.lump_months for p in plans]),
+            *cls._pack([p.monthly_amts for p in plans], [p.monthly_months for p in plans]),
+        )
+
+    @staticmethod
+    def _pack(amts, months):
+        offsets = np.zeros(len(amts) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(a) for a in amts])
+        flat_amts = np.concatenate(amts) if amts else np.empty(0)
+        flat_months = np.concatenate(months) if months else np.empty(0, dtype=np.int64)
+        return flat_amts, flat_months, offsets
+
+    def validate(self):
+        """Raise ValueError if the columns are inconsistent."""
+        n = len(self.start_year)
+        for name in self._SCALARS:
+            if len(getattr(self, name)) != n:
+                raise ValueError(f"{name} has {len(getattr(self, name))} entries, expected {n}")
+        for amts, months, offsets, label in (
+            (self.lump_amts, self.lump_months, self.lump_offsets, "lump"),
+            (self.monthly_amts, self.monthly_months, self.monthly_offsets, "monthly"),
+        ):
+            if len(amts) != len(months):
+                raise ValueError(f"{label} amounts and dates differ in length")
+            if (len(offsets) != n + 1 or offsets[0] != 0 or offsets[-1] != len(amts)
+                    or (np.diff(offsets) < 0).any()):
+                raise ValueError(f"{label} offsets do not partition the {label} entries")
+        _check_values(
+            self.years_to_retire, self.years_post, self.return_rate,
+            self.inflation_rate, self.monthly_expenses,
+            self.lump_amts, self.lump_months, self.monthly_amts, self.monthly_months,
+        )
+
+    def __len__(self):
+        return len(self.start_year)
+
+    def __getitem__(self, i):
+        i = operator.index(i)
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("plan index out of range")
+        lo, hi = self.lump_offsets[i], self.lump_offsets[i + 1]
+        mlo, mhi = self.monthly_offsets[i], self.monthly_offsets[i + 1]
+        return PlanInputs(
+            self.start_year[i], self.years_to_retire[i], self.years_post[i],
+            self.return_rate[i], self.inflation_rate[i], self.monthly_expenses[i],
+            self.lump_amts[lo:hi], self.lump_months[lo:hi],
+            self.monthly_amts[mlo:mhi], self.monthly_months[mlo:mhi],
+        )
+
+    @property
+    def key(self):
+        """Stable hex digest of the whole batch, usable as a cache key."""
+        if self._key is None:
+            h = hashlib.blake2b(digest_size=16)
+            h.update(np.array([
+                len(self), len(self.lump_amts), len(self.monthly_amts),
+            ], dtype=np.int64).tobytes())
+            for name in self._FIELDS:
+                h.update(getattr(self, name).tobytes())
+            object.__setattr__(self, "_key", h.hexdigest())
+        return self._key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __eq__(self, other):
+        if not isinstance(other, PlanBatch):
+            return NotImplemented
+        return self.key == other.key
+
+    def __repr__(self):
+        return f"PlanBatch(plans={len(self)}, key={self.key[:8]})"
+
+    def to_dict(self):
+        """JSON-friendly column lists; inverse of ``from_dict``."""
+        return {name: getattr(self, name).tolist() for name in self._FIELDS}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+    def yearly_contributions(self):
+        """Total invested per plan and year, shape (plans, max years).
+
+        Column ``j`` is calendar year ``start_year + j`` of each plan; years
+        past a plan's retirement year stay zero. Non-positive amounts are
+        ignored, as in the sidebar.
+        """
+        n_years = int(self.years_to_retire.max()) + 1 if len(self) else 0
+        out = np.zeros((len(self), n_years))
+        if not n_years:
+            return out
+        offsets = np.arange(n_years)
+
+        # Monthly streams: count the months each stream pays in each year.
+        plan = np.repeat(np.arange(len(self)), np.diff(self.monthly_offsets))
+        keep = self.monthly_amts > 0
+        plan, amts, start = plan[keep], self.monthly_amts[keep], self.monthly_months[keep]
+        year = self.start_year[plan][:, None] + offsets
+        counts = np.clip(year * 12 + 12 - np.maximum(start[:, None], year * 12), 0, 12)
+        counts[offsets > self.years_to_retire[plan][:, None]] = 0
+        np.add.at(out, plan, amts[:, None] * counts)
+
+        # Lump sums: add each one to the year it falls in.
+        plan = np.repeat(np.arange(len(self)), np.diff(self.lump_offsets))
+        col = self.lump_months // 12 - self.start_year[plan]
+        keep = (self.lump_amts > 0) & (col >= 0) & (col <= self.years_to_retire[plan])
+        np.add.at(out, (plan[keep], col[keep]), self.lump_amts[keep])
+        return out
@@ -0,0 +1,222 @@
+import json
+from datetime import date
+
+import numpy as np
+import pytest
+
+from plan_inputs import PlanBatch, PlanInputs, month_index
+
+
+def make_plan(**overrides):
+    fields = dict(
+        start_year=2026, years_to_retire=10, years_post=20,
+        return_rate=0.07, inflation_rate=0.03, monthly_expenses=5000,
+        lump_amts=[10000, 2500], lump_months=[24323, 24342],
+        monthly_amts=[500, 200], monthly_months=[24323, 24352],
+    )
+    fields.update(overrides)
+    return PlanInputs(**fields)
+
+
+def make_batch():
+    return PlanBatch.from_plans([make_plan(), PlanInputs(2026, 5, 25, 0.05, 0.02, 3000)])
+
+
+def test_month_index():
+    assert month_index(date(2026, 1, 31)) == 2026 * 12
+    assert month_index(date(2026, 12, 1)) == 2026 * 12 + 11
+
+
+def test_from_dates_matches_month_indices():
+    plan = PlanInputs.from_dates(
+        2026, 10, 20, 0.07, 0.03, 5000,
+        lump_amts=[10000, 2500], lump_dates=[date(2026, 12, 5), date(2028, 7, 1)],
+        monthly_amts=[500, 200], monthly_dates=[date(2026, 12, 31), date(2029, 5, 15)],
+    )
+    assert plan == make_plan()
+
+
+def test_plan_round_trip():
+    plan = make_plan()
+    restored = PlanInputs.from_dict(json.loads(json.dumps(plan.to_dict())))
+    assert restored == plan
+    assert restored.key == plan.key
+    assert hash(restored) == hash(plan)
+
+
+def test_plan_key_is_stable():
+    # The key is a cache key, so it must not change between runs.
+    assert make_plan().key == "f3967a4e768384117514abae92ed8b7a"
+    assert make_plan().key == make_plan().key
+
+
+@pytest.mark.parametrize("overrides", [
+    dict(return_rate=0.0701),
+    dict(years_to_retire=11),
+    dict(lump_amts=[10000, 2501]),
+    dict(monthly_months=[24323, 24353]),
+    dict(lump_amts=[10000], lump_months=[24323]),
+])
+def test_plan_key_changes_with_inputs(overrides):
+    assert make_plan(**overrides).key != make_plan().key
+
+
+def test_plan_is_immutable():
+    plan = make_plan()
+    key = plan.key
+    with pytest.raises(AttributeError):
+        plan.return_rate = 0.05
+    with pytest.raises(AttributeError):
+        del plan.years_post
+    with pytest.raises(ValueError):
+        plan.lump_amts[0] = 1.0
+    assert plan.key == key
+
+
+@pytest.mark.parametrize("overrides", [
+    dict(years_to_retire=-1),
+    dict(years_post=0),
+    dict(return_rate=float("nan")),
+    dict(inflation_rate=-1.0),
+    dict(monthly_expenses=-1),
+    dict(lump_amts=[10000]),
+    dict(monthly_amts=[500, float("inf")]),
+    dict(lump_months=[-1, 24342]),
+])
+def test_plan_validation(overrides):
+    with pytest.raises(ValueError):
+        make_plan(**overrides)
+
+
+def test_batch_round_trip():
+    batch = make_batch()
+    restored = PlanBatch.from_dict(json.loads(json.dumps(batch.to_dict())))
+    assert restored == batch
+    assert hash(restored) == hash(batch)
+    assert batch.key == "6aa4331b6220c5e735979461004416da"
+
+
+def test_batch_indexing():
+    plans = [make_plan(), PlanInputs(2026, 5, 25, 0.05, 0.02, 3000)]
+    batch = PlanBatch.from_plans(plans)
+    assert len(batch) == 2
+    assert batch[0] == plans[0]
+    assert batch[-1] == plans[1]
+    assert batch[-2] == plans[0]
+    assert batch[np.int64(1)] == plans[1]
+    for i in (2, -3):
+        with pytest.raises(IndexError):
+            batch[i]
+    with pytest.raises(TypeError):
+        batch[0.5]
+
+
+def test_batch_is_immutable():
+    batch = make_batch()
+    with pytest.raises(AttributeError):
+        batch.return_rate = np.zeros(2)
+
+
+@pytest.mark.parametrize("field, value", [
+    ("years_post", [20]),
+    ("lump_offsets", [0, 3, 2]),
+    ("lump_offsets", [0, 1, 1]),
+    ("monthly_months", [24323]),
+    ("return_rate", [0.07, -2.0]),
+])
+def test_batch_validation(field, value):
+    data = make_batch().to_dict()
+    data[field] = value
+    with pytest.raises(ValueError):
+        PlanBatch.from_dict(data)
+
+
+def old_yearly_totals(start_year, end_year, monthly, lumps):
+    # The per-date loop app.py used before PlanInputs, kept as the reference.
+    monthly_contribs = []
+    for start, amt in monthly:
+        if amt <= 0:
+            continue
+        current = start
+        while current <= date(end_year, 12, 1):
+            monthly_contribs.append((current, amt))
+            if current.month == 12:
+                current = current.replace(year=current.year + 1, month=1)
+            else:
+                current = current.replace(month=current.month + 1)
+    lumps = [(dt, amt) for dt, amt in lumps if amt > 0]
+    return [
+        sum(amt for dt, amt in monthly_contribs if dt.year == year)
+        + sum(amt for dt, amt in lumps if dt.year == year)
+        for year in range(start_year, end_year + 1)
+    ]
+
+
+def contributions(monthly=(), lumps=(), start_year=2026, years_to_retire=4):
+    plan = PlanInputs.from_dates(
+        start_year, years_to_retire, 20, 0.07, 0.03, 5000,
+        lump_amts=[amt for _, amt in lumps], lump_dates=[dt for dt, _ in lumps],
+        monthly_amts=[amt for _, amt in monthly], monthly_dates=[dt for dt, _ in monthly],
+    )
+    return plan.yearly_contributions()
+
+
+def test_yearly_contributions_match_old_loop_on_first_of_month():
+    monthly = [(date(2026, 3, 1), 500), (date(2028, 12, 1), 200), (date(2026, 1, 1), 50)]
+    lumps = [(date(2026, 3, 1), 10000), (date(2029, 6, 1), 2500)]
+    assert contributions(monthly, lumps).tolist() == old_yearly_totals(2026, 2030, monthly, lumps)
+
+
+def test_yearly_contributions_count_last_december_mid_month():
+    # The old loop compared dates against 1 December of the retirement year,
+    # so a stream starting after the 1st skipped its final December.
+    monthly = [(date(2026, 3, 15), 500)]
+    old = old_yearly_totals(2026, 2030, monthly, [])
+    new = contributions(monthly)
+    assert new[:-1].tolist() == old[:-1]
+    assert new[-1] == old[-1] + 500
+
+
+def test_yearly_contributions_handle_month_end_start():
+    # The old loop raised ValueError stepping from the 31st into a short month.
+    monthly = [(date(2026, 1, 31), 500)]
+    with pytest.raises(ValueError):
+        old_yearly_totals(2026, 2030, monthly, [])
+    expected = old_yearly_totals(2026, 2030, [(date(2026, 1, 1), 500)], [])
+    assert contributions(monthly).tolist() == expected
+
+
+def test_yearly_contributions_ignore_lumps_outside_horizon():
+    lumps = [(date(2025, 12, 31), 1000), (date(2026, 1, 1), 10), (date(2030, 12, 31), 20),
+             (date(2031, 1, 1), 4000)]
+    assert contributions(lumps=lumps).tolist() == [10, 0, 0, 0, 20]
+
+
+def test_yearly_contributions_skip_non_positive_amounts():
+    monthly = [(date(2026, 1, 1), 0), (date(2026, 1, 1), -100), (date(2029, 7, 1), 100)]
+    lumps = [(date(2027, 5, 1), 0), (date(2027, 5, 1), -500), (date(2028, 5, 1), 300)]
+    assert contributions(monthly, lumps).tolist() == [0, 0, 300, 600, 1200]
+
+
+def test_yearly_contributions_stream_starting_after_retirement():
+    assert contributions([(date(2031, 1, 1), 100)]).tolist() == [0] * 5
+
+
+def test_yearly_contributions_zero_years_to_retire():
+    monthly = [(date(2026, 10, 1), 100)]
+    assert contributions(monthly, years_to_retire=0).tolist() == [300]
+
+
+def test_batch_yearly_contributions_match_single_plans():
+    plans = [
+        make_plan(),
+        PlanInputs(2027, 2, 25, 0.05, 0.02, 3000, [700], [month_index(date(2028, 2, 1))],
+                   [50], [month_index(date(2027, 11, 1))]),
+        PlanInputs(2026, 0, 25, 0.05, 0.02, 3000),
+    ]
+    totals = PlanBatch.from_plans(plans).yearly_contributions()
+    assert totals.shape == (3, 11)
+    for row, plan in zip(totals, plans):
+        n = plan.years_to_retire + 1
+        np.testing.assert_array_equal(row[:n], plan.yearly_contributions())
+        assert not row[n:].any()